@@ -1,15 +1,24 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 import json
 import calendar
+import atexit
+import functools
+import hashlib
+import operator
 import tkinter as tk
 from tkinter import ttk, messagebox
 import re
 from urllib.parse import urlsplit, urlunsplit
 import os
 import sys
-import queue
 import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from tkcalendar import DateEntry
 import keyring  # For secure API key storage
 
@@ -26,10 +35,19 @@ APP_DIR = (
 APP_CONFIG_FILE = os.path.join(APP_DIR, "app_config.json")
 PRESETS_FILE = os.path.join(APP_DIR, "config.json")
 API_BASE_URL = ""  # Loaded from APP_CONFIG_FILE at runtime
+ENDPOINTS = {}  # Endpoint URLs derived from API_BASE_URL whenever it is loaded
 SERVICE_NAME = "ImmichHolidayAlbumCollector"  # Keyring service name
 LEGACY_SERVICE_NAME = "HolidayAssetCollector"  # Backwards-compatible keyring service name
 KEY_NAME = "api_key"  # Key name for storing in keyring
 REQUEST_TIMEOUT_SECONDS = 30
+DEFAULT_REQUEST_WORKERS = 8  # Concurrent searches per run; override with `request_workers` in APP_CONFIG_FILE
+MAX_REQUEST_WORKERS = 16
+REQUEST_WORKERS = DEFAULT_REQUEST_WORKERS  # Loaded from APP_CONFIG_FILE at runtime
+SEARCH_PAGE_PREFETCH = 4  # Search result pages fetched concurrently once a range spans several pages
+ADD_ASSETS_BATCH_SIZE = 1000  # Max asset IDs per PUT /albums/{id}/assets
+PEOPLE_CACHE_TTL_SECONDS = 60  # How long the people picker list and resolved person names are reused
+LISTBOX_INSERT_BATCH = 500  # People picker rows inserted per event-loop turn
+DEBUG_HTTP = False  # Log full request payloads (large and slow for asset ID lists)
 
 DEFAULT_HOLIDAYS = [
     "New Year's Day",
@@ -49,9 +67,71 @@ DEFAULT_HOLIDAYS = [
 
 LOG_FILE = os.path.join(APP_DIR, f"{APP_SLUG}.log")
 
+class ProgressState:
+    """Latest status/progress plus buffered log lines, shared by worker threads and the UI poller."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._status = None
+        self._progress = None
+        self._log_buffer = []
+        self._run_finished = False
+
+    def set_status(self, text):
+        with self._lock:
+            self._status = text
+
+    def set_progress(self, value, max_value):
+        with self._lock:
+            self._progress = (value, max_value)
+
+    def add_log(self, text):
+        with self._lock:
+            self._log_buffer.append(text)
+
+    def mark_run_finished(self):
+        with self._lock:
+            self._run_finished = True
+
+    def drain(self):
+        """Return (status, progress, log_lines, run_finished) since the last drain; None means unchanged."""
+        with self._lock:
+            status, progress, log_lines = self._status, self._progress, self._log_buffer
+            run_finished = self._run_finished
+            self._status, self._progress, self._log_buffer = None, None, []
+            self._run_finished = False
+        return status, progress, log_lines, run_finished
+
 # Global variables for inter-thread communication
 stop_event = threading.Event()
-progress_queue = queue.Queue()  # Global queue for inter-thread communication
+progress_state = ProgressState()  # Coalesces updates; the UI only shows the latest status/progress
+person_id_cache = {}  # (api_base_url, api_key_sha256, name_lower, with_hidden) -> (resolved_at, person id)
+people_cache = {}  # (api_base_url, api_key_sha256, with_hidden) -> (loaded_at, entries, display_texts)
+# Caps in-flight search POSTs across all searches and page prefetches at REQUEST_WORKERS.
+search_request_slots = threading.BoundedSemaphore(DEFAULT_REQUEST_WORKERS)
+
+def create_http_session(retry_methods=Retry.DEFAULT_ALLOWED_METHODS):
+    """Create a pooled HTTP session so API calls reuse TCP/TLS connections."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=MAX_REQUEST_WORKERS,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=retry_methods,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+SESSION = create_http_session()  # Shared by all API helpers, the key check and the people picker
+atexit.register(SESSION.close)
+# /search/metadata is a read-only POST, so unlike album creation it is safe to retry.
+SEARCH_SESSION = create_http_session(retry_methods=Retry.DEFAULT_ALLOWED_METHODS | {"POST"})
+atexit.register(SEARCH_SESSION.close)
 
 def get_stored_api_key():
     for service_name in (SERVICE_NAME, LEGACY_SERVICE_NAME):
@@ -119,29 +199,75 @@ def load_app_config(filename=APP_CONFIG_FILE):
     except OSError as e:
         return {}, f"Failed to read {filename}: {e}"
 
+def _normalize_request_workers(value):
+    if isinstance(value, bool) or not isinstance(value, int):
+        return DEFAULT_REQUEST_WORKERS
+    return max(1, min(value, MAX_REQUEST_WORKERS))
+
+def _build_endpoints(api_base_url):
+    return {
+        "albums": f"{api_base_url}/albums",
+        "people": f"{api_base_url}/people",
+        "search_metadata": f"{api_base_url}/search/metadata",
+        "search_person": f"{api_base_url}/search/person",
+    }
+
 def set_api_base_url_from_config():
-    """Set API_BASE_URL from app_config.json; returns (url, error_message)."""
-    global API_BASE_URL
+    """Set API_BASE_URL/ENDPOINTS (and REQUEST_WORKERS) from app_config.json; returns (url, error_message)."""
+    global API_BASE_URL, ENDPOINTS, REQUEST_WORKERS, search_request_slots
     config, error = load_app_config()
     API_BASE_URL = _normalize_api_base_url(config.get("api_base_url", ""))
+    ENDPOINTS = _build_endpoints(API_BASE_URL)
+    REQUEST_WORKERS = _normalize_request_workers(config.get("request_workers"))
+    search_request_slots = threading.BoundedSemaphore(REQUEST_WORKERS)
     return API_BASE_URL, error
 
 # -------------------------------
 # Logging and Status Functions
 # -------------------------------
+log_file_handle = None  # Opened lazily by log_message, line-buffered
+log_file_lock = threading.Lock()
+
+def close_log_file():
+    global log_file_handle
+    with log_file_lock:
+        if log_file_handle is not None:
+            log_file_handle.close()
+            log_file_handle = None
+
+def reset_log_file():
+    """Close and delete the log file so the next message starts a fresh one."""
+    close_log_file()
+    if os.path.exists(LOG_FILE):
+        os.remove(LOG_FILE)
+
 def log_message(message):
-    """Log a message to both file and GUI queue."""
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(message + "\n")
-    progress_queue.put({"type": "log", "text": message})
+    """Log a message to both file and the GUI log buffer."""
+    global log_file_handle
+    with log_file_lock:
+        if log_file_handle is None:
+            log_file_handle = open(LOG_FILE, "a", encoding="utf-8", buffering=1)
+        log_file_handle.write(message + "\n")
+    progress_state.add_log(message)
+
+atexit.register(close_log_file)
+
+def describe_payload(payload):
+    """Summarize a request payload for the log; full compact JSON only when DEBUG_HTTP is on."""
+    if DEBUG_HTTP:
+        return json.dumps(payload, separators=(",", ":"))
+    return ", ".join(
+        f"{key}=[{len(value)} items]" if isinstance(value, (list, dict)) else f"{key}={value}"
+        for key, value in payload.items()
+    )
 
 def set_status(text):
-    """Update the status label via the queue."""
-    progress_queue.put({"type": "status", "text": text})
+    """Update the status label (latest value wins)."""
+    progress_state.set_status(text)
 
 def set_progress(value, max_value):
-    """Update the progress bar via the queue."""
-    progress_queue.put({"type": "progress", "value": value, "max": max_value})
+    """Update the progress bar (latest value wins)."""
+    progress_state.set_progress(value, max_value)
 
 # -------------------------------
 # Date Calculation Helpers
@@ -149,20 +275,18 @@ def set_progress(value, max_value):
 def get_fixed_date(year, month, day):
     return datetime(year, month, day)
 
+@functools.lru_cache(maxsize=None)
 def get_nth_weekday_of_month(year, month, weekday, nth):
-    d = datetime(year, month, 1)
-    while d.weekday() != weekday:
-        d += timedelta(days=1)
-    d += timedelta(weeks=(nth-1))
-    return d
+    offset = (weekday - calendar.weekday(year, month, 1)) % 7
+    return datetime(year, month, 1 + offset + 7 * (nth - 1))
 
+@functools.lru_cache(maxsize=None)
 def get_last_weekday_of_month(year, month, weekday):
     days_in_month = calendar.monthrange(year, month)[1]
-    d = datetime(year, month, days_in_month)
-    while d.weekday() != weekday:
-        d -= timedelta(days=1)
-    return d
+    offset = (calendar.weekday(year, month, days_in_month) - weekday) % 7
+    return datetime(year, month, days_in_month - offset)
 
+@functools.lru_cache(maxsize=None)
 def get_easter_date(year):
     a = year % 19
     b = year // 100
@@ -180,6 +304,7 @@ def get_easter_date(year):
     day = ((h + l - 7*m + 114) % 31) + 1
     return datetime(year, month, day)
 
+@functools.lru_cache(maxsize=None)
 def get_holiday_date(year, holiday_name):
     if holiday_name == "New Year's Day":
         return get_fixed_date(year, 1, 1)
@@ -210,51 +335,76 @@ def get_holiday_date(year, holiday_name):
     else:
         raise ValueError(f"Unknown holiday: {holiday_name}")
 
+def get_date_range(base_date, delta_days):
+    """Return the (start, end) search window around base_date; delta 0 searches that whole day."""
+    if delta_days == 0:
+        day_start = datetime(base_date.year, base_date.month, base_date.day)
+        return day_start, day_start + timedelta(days=1)
+    delta = timedelta(days=delta_days)
+    return base_date - delta, base_date + delta
+
 # -------------------------------
 # API Interaction Functions
 # -------------------------------
-def find_or_create_album(headers, album_name):
-    url = f"{API_BASE_URL}/albums"
-    log_message(f"GET {url}")
-    try:
-        r = requests.get(url, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS)
-        r.raise_for_status()
-    except requests.RequestException as e:
-        error_msg = f"Failed to fetch albums: {str(e)}"
-        log_message(error_msg)
-        set_status(error_msg)
-        raise
-    log_message(f"Response: {r.status_code}")
-    albums = r.json()
+def encode_json_body(payload):
+    """Serialize a request body once, without the padding requests' `json=` adds after separators.
 
-    for album in albums:
-        if album.get("albumName") == album_name:
-            log_message(f"Found existing album for {album_name}: {album['id']}")
-            return album["id"]
+    Callers pass headers that already carry `Content-Type: application/json`.
+    """
+    return json.dumps(payload, separators=(",", ":"), allow_nan=False).encode("utf-8")
 
-    payload = {
-        "albumName": album_name,
-        "assetIds": []
-    }
-    log_message(f"POST {url} with payload: {json.dumps(payload, indent=2)}")
-    try:
-        r = requests.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT_SECONDS)
-        r.raise_for_status()
-    except requests.RequestException as e:
-        error_msg = f"Failed to create album: {str(e)}"
-        log_message(error_msg)
-        set_status(error_msg)
-        raise
-    new_album = r.json()
-    log_message(f"Created new album for {album_name}: {new_album['id']}")
-    return new_album["id"]
+class AlbumIndex:
+    """Album name -> id lookup, fetched once per run so each holiday doesn't re-list /albums."""
+
+    def __init__(self, headers):
+        self.headers = headers
+        self.url = ENDPOINTS["albums"]
+        log_message(f"GET {self.url}")
+        try:
+            r = SESSION.get(self.url, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS)
+            r.raise_for_status()
+        except requests.RequestException as e:
+            error_msg = f"Failed to fetch albums: {str(e)}"
+            log_message(error_msg)
+            set_status(error_msg)
+            raise
+        log_message(f"Response: {r.status_code}")
+
+        self._album_ids = {}
+        for album in r.json():
+            # Keep the first match, as the previous linear scan did.
+            self._album_ids.setdefault(album.get("albumName"), album["id"])
+
+    def get_or_create(self, album_name):
+        album_id = self._album_ids.get(album_name)
+        if album_id:
+            log_message(f"Found existing album for {album_name}: {album_id}")
+            return album_id
+
+        payload = {
+            "albumName": album_name,
+            "assetIds": []
+        }
+        log_message(f"POST {self.url} with payload: {describe_payload(payload)}")
+        try:
+            r = SESSION.post(self.url, headers=self.headers, data=encode_json_body(payload), timeout=REQUEST_TIMEOUT_SECONDS)
+            r.raise_for_status()
+        except requests.RequestException as e:
+            error_msg = f"Failed to create album: {str(e)}"
+            log_message(error_msg)
+            set_status(error_msg)
+            raise
+        new_album = r.json()
+        log_message(f"Created new album for {album_name}: {new_album['id']}")
+        self._album_ids[album_name] = new_album["id"]
+        return new_album["id"]
 
 def search_people_by_name(headers, name, with_hidden=False):
-    url = f"{API_BASE_URL}/search/person"
+    url = ENDPOINTS["search_person"]
     params = {"name": name, "withHidden": with_hidden}
     log_message(f"GET {url} (person search)")
     try:
-        r = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+        r = SESSION.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
         r.raise_for_status()
     except requests.RequestException as e:
         error_msg = f"Failed to search people: {str(e)}"
@@ -264,7 +414,7 @@ def search_people_by_name(headers, name, with_hidden=False):
     return r.json()
 
 def get_all_people(headers, with_hidden=False):
-    url = f"{API_BASE_URL}/people"
+    url = ENDPOINTS["people"]
     page_size = 1000
     page = 1
     people = []
@@ -279,7 +429,7 @@ def get_all_people(headers, with_hidden=False):
 
         log_message(f"GET {url} (people list page {page})")
         try:
-            r = requests.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
+            r = SESSION.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT_SECONDS)
             r.raise_for_status()
         except requests.RequestException as e:
             error_msg = f"Failed to fetch people: {str(e)}"
@@ -292,7 +442,11 @@ def get_all_people(headers, with_hidden=False):
         if not page_people:
             break
 
-        people.extend(page_people)
+        # Keep only the fields the picker uses so the full person payloads can be freed per page.
+        people.extend(
+            {"id": p.get("id"), "name": p.get("name"), "isHidden": p.get("isHidden", False)}
+            for p in page_people
+        )
 
         has_next_page = data.get("hasNextPage")
         total = data.get("total")
@@ -308,80 +462,130 @@ def get_all_people(headers, with_hidden=False):
 
     return people
 
+def fetch_search_page(headers, start_date, end_date, additional_filters, page, page_size):
+    """POST one /search/metadata page and return its asset items."""
+    payload = {"withDeleted": False}
+    if additional_filters:
+        payload.update(additional_filters)
+    payload.update({
+        "takenAfter": start_date.isoformat(),
+        "takenBefore": end_date.isoformat(),
+        "size": page_size,
+        "page": page,
+    })
+
+    url = ENDPOINTS["search_metadata"]
+    log_message(f"POST {url} with payload: {describe_payload(payload)}")
+    slots = search_request_slots  # Same object for acquire and release even if the config is reloaded
+    try:
+        with slots:
+            r = SEARCH_SESSION.post(url, headers=headers, data=encode_json_body(payload), timeout=REQUEST_TIMEOUT_SECONDS)
+        r.raise_for_status()
+    except requests.RequestException as e:
+        error_msg = f"Failed to search assets: {str(e)}"
+        log_message(error_msg)
+        set_status(error_msg)
+        raise
+    log_message(f"Response: {r.status_code}")
+
+    search_results = r.json()
+    return search_results.get("assets", {}).get("items", [])
+
 def search_assets_by_date_range(headers, start_date, end_date, additional_filters=None):
     page_size = 100
-    current_page = 1
-    all_asset_ids = []
 
-    while True:
-        if stop_event.is_set():
-            log_message("Search interrupted by user.")
-            return []
-        payload = {"withDeleted": False}
-        if additional_filters:
-            payload.update(additional_filters)
-        payload.update({
-            "takenAfter": start_date.isoformat(),
-            "takenBefore": end_date.isoformat(),
-            "size": page_size,
-            "page": current_page,
-        })
-
-        url = f"{API_BASE_URL}/search/metadata"
-        log_message(f"POST {url} with payload: {json.dumps(payload, indent=2)}")
-        try:
-            r = requests.post(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT_SECONDS)
-            r.raise_for_status()
-        except requests.RequestException as e:
-            error_msg = f"Failed to search assets: {str(e)}"
-            log_message(error_msg)
-            set_status(error_msg)
-            raise
-        log_message(f"Response: {r.status_code}")
-
-        search_results = r.json()
-        assets = search_results.get("assets", {}).get("items", [])
-        if not assets:
-            break
-
-        all_asset_ids.extend([asset["id"] for asset in assets])
-
-        if len(assets) < page_size:
-            break
+    if stop_event.is_set():
+        log_message("Search interrupted by user.")
+        return []
+
+    # Page 1 is fetched alone so most (small) date ranges cost a single request.
+    assets = fetch_search_page(headers, start_date, end_date, additional_filters, 1, page_size)
+    # A set drops duplicates the server can return across pages.
+    all_asset_ids = {asset["id"] for asset in assets}
 
-        current_page += 1
+    if len(assets) == page_size:
+        # `assets.total` only counts the current page, so prefetch fixed windows of
+        # pages until one comes back short.
+        next_page = 2
+        with ThreadPoolExecutor(max_workers=SEARCH_PAGE_PREFETCH) as executor:
+            while True:
+                if stop_event.is_set():
+                    log_message("Search interrupted by user.")
+                    return []
+                pages = range(next_page, next_page + SEARCH_PAGE_PREFETCH)
+                results = list(executor.map(
+                    lambda page: fetch_search_page(headers, start_date, end_date, additional_filters, page, page_size),
+                    pages,
+                ))
+                for page_assets in results:
+                    all_asset_ids.update(asset["id"] for asset in page_assets)
+                if any(len(page_assets) < page_size for page_assets in results):
+                    break
+                next_page += SEARCH_PAGE_PREFETCH
 
     log_message(f"Found {len(all_asset_ids)} total assets in the date range {start_date} - {end_date}")
-    return all_asset_ids
+    return list(all_asset_ids)
+
+def find_earliest_asset_date(headers, start_date, end_date, additional_filters=None):
+    """Return when the oldest asset in the range was taken, or None if the range is empty.
+
+    A single size=1 search sorted oldest-first, so callers can skip empty years up front.
+    """
+    filters = dict(additional_filters or {})
+    filters["order"] = "asc"
+    assets = fetch_search_page(headers, start_date, end_date, filters, 1, 1)
+    if not assets:
+        return None
+    try:
+        taken_at = datetime.fromisoformat(assets[0]["fileCreatedAt"])
+    except (KeyError, TypeError, ValueError):
+        return start_date  # Unknown: don't skip anything
+    return taken_at.replace(tzinfo=None)
 
 def add_assets_to_album(headers, album_id, asset_ids):
     if not asset_ids:
         log_message("No assets to add to album.")
         return 0
-    payload = {"ids": asset_ids}
-    url = f"{API_BASE_URL}/albums/{album_id}/assets"
-    log_message(f"PUT {url} with payload: {json.dumps(payload, indent=2)}")
-    try:
-        r = requests.put(url, headers=headers, json=payload, timeout=REQUEST_TIMEOUT_SECONDS)
-        r.raise_for_status()
-    except requests.RequestException as e:
-        error_msg = f"Failed to add assets to album: {str(e)}"
-        log_message(error_msg)
-        set_status(error_msg)
-        raise
+    url = f"{ENDPOINTS['albums']}/{album_id}/assets"
+    for i in range(0, len(asset_ids), ADD_ASSETS_BATCH_SIZE):
+        payload = {"ids": asset_ids[i:i + ADD_ASSETS_BATCH_SIZE]}
+        log_message(f"PUT {url} with payload: {describe_payload(payload)}")
+        try:
+            r = SESSION.put(url, headers=headers, data=encode_json_body(payload), timeout=REQUEST_TIMEOUT_SECONDS)
+            r.raise_for_status()
+        except requests.RequestException as e:
+            error_msg = f"Failed to add assets to album: {str(e)}"
+            log_message(error_msg)
+            set_status(error_msg)
+            raise
     log_message(f"Added {len(asset_ids)} assets to album {album_id}.")
     return len(asset_ids)
 
 # -------------------------------
 # Advanced Search Helpers
 # -------------------------------
-UUID_PATTERN = re.compile(r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$")
+UUID_PREFIX_PATTERN = re.compile(r"[0-9a-fA-F-]{36}")
+UUID_FINDALL_PATTERN = re.compile(
+    r"\b[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}\b"
+)
+# People picker search syntax: OR via , ; | || or; AND via whitespace/and.
+PEOPLE_SEARCH_OR_PATTERN = re.compile(r"\s*(?:,|;|\|\|?|\bor\b)\s*", re.IGNORECASE)
+PEOPLE_SEARCH_AND_PATTERN = re.compile(r"\band\b", re.IGNORECASE)
+WHITESPACE_PATTERN = re.compile(r"\s+")
+FILTERS_JSON_DECODER = json.JSONDecoder()  # Shared by Validate JSON and Run
+
+def is_uuid(value):
+    """True for a canonical hyphenated UUID string (any case)."""
+    try:
+        return str(uuid.UUID(value)) == value.lower()
+    except ValueError:
+        return False
 
 def parse_additional_filters_json(filters_text):
     if not filters_text or not filters_text.strip():
         return {}, None
     try:
-        data = json.loads(filters_text)
+        data = FILTERS_JSON_DECODER.decode(filters_text)
     except json.JSONDecodeError as e:
         return {}, f"Invalid JSON for additional filters: {e}"
     if not isinstance(data, dict):
@@ -407,10 +611,10 @@ def parse_people_input(people_text):
         if not candidate:
             continue
 
-        uuid_prefix = re.match(r"^([0-9a-fA-F-]{36})", candidate)
+        uuid_prefix = UUID_PREFIX_PATTERN.match(candidate)
         if uuid_prefix:
-            possible_uuid = uuid_prefix.group(1)
-            if UUID_PATTERN.match(possible_uuid):
+            possible_uuid = uuid_prefix.group()
+            if is_uuid(possible_uuid):
                 tokens.append(possible_uuid)
                 continue
 
@@ -425,23 +629,34 @@ def resolve_person_ids(headers, people_text, with_hidden=False):
 
     resolved_ids = []
     seen = set()
+    # People belong to the key's user, so the key is part of the cache key (hashed, not stored).
+    api_key_hash = hashlib.sha256(headers["x-api-key"].encode("utf-8")).hexdigest()
 
     for token in tokens:
         if stop_event.is_set():
             return []
 
-        if UUID_PATTERN.match(token):
+        if is_uuid(token):
             person_id = token
             if person_id not in seen:
                 seen.add(person_id)
                 resolved_ids.append(person_id)
             continue
 
+        token_lower = token.lower()
+        cache_key = (API_BASE_URL, api_key_hash, token_lower, bool(with_hidden))
+        cached = person_id_cache.get(cache_key)
+        if cached and time.monotonic() - cached[0] < PEOPLE_CACHE_TTL_SECONDS:
+            person_id = cached[1]
+            if person_id not in seen:
+                seen.add(person_id)
+                resolved_ids.append(person_id)
+            continue
+
         matches = search_people_by_name(headers, token, with_hidden=with_hidden)
         if not matches:
             raise ValueError(f"No person found matching '{token}'.")
 
-        token_lower = token.lower()
         exact_matches = [
             p for p in matches
             if str(p.get("name", "")).strip().lower() == token_lower
@@ -461,6 +676,7 @@ def resolve_person_ids(headers, people_text, with_hidden=False):
         person_id = person.get("id")
         if not person_id:
             raise ValueError(f"Person search result missing id for '{token}'.")
+        person_id_cache[cache_key] = (time.monotonic(), person_id)
 
         if person_id not in seen:
             seen.add(person_id)
@@ -477,20 +693,33 @@ def search_assets_for_date_range(headers, start_date, end_date, additional_filte
     if not person_ids:
         return search_assets_by_date_range(headers, start_date, end_date, additional_filters=additional_filters)
 
+    # One copy of the base filters; only personIds changes between the (sequential) searches below.
+    filters = dict(additional_filters or {})
+
     if len(person_ids) == 1:
-        filters = dict(additional_filters or {})
         filters["personIds"] = [person_ids[0]]
         return search_assets_by_date_range(headers, start_date, end_date, additional_filters=filters)
 
     if people_match_mode == "all":
+        # Immich treats multiple personIds as AND, so try a single server-side search first.
+        filters["personIds"] = list(person_ids)
+        try:
+            return search_assets_by_date_range(headers, start_date, end_date, additional_filters=filters)
+        except requests.HTTPError as e:
+            status_code = getattr(e.response, "status_code", None)
+            if status_code not in (400, 422):
+                raise
+            log_message(f"Server rejected multi-person search ({status_code}); falling back to per-person searches.")
+
         intersection = None
         for person_id in person_ids:
             if stop_event.is_set():
                 return []
-            filters = dict(additional_filters or {})
             filters["personIds"] = [person_id]
             ids = set(search_assets_by_date_range(headers, start_date, end_date, additional_filters=filters))
             intersection = ids if intersection is None else (intersection & ids)
+            if not intersection:
+                break
         return list(intersection or set())
 
     # Default: any (OR)
@@ -498,7 +727,6 @@ def search_assets_for_date_range(headers, start_date, end_date, additional_filte
     for person_id in person_ids:
         if stop_event.is_set():
             return []
-        filters = dict(additional_filters or {})
         filters["personIds"] = [person_id]
         union.update(search_assets_by_date_range(headers, start_date, end_date, additional_filters=filters))
     return list(union)
@@ -517,7 +745,7 @@ def run_search(
     specific_date_all_years,
     people_text="",
     people_match_mode="any",
-    additional_filters_text="",
+    additional_filters=None,
     people_with_hidden=False,
 ):
     stop_event.clear()  # Reset stop event
@@ -538,11 +766,8 @@ def run_search(
     log_message("Starting asset collection...")
     total_assets_added = 0
 
-    additional_filters, filters_error = parse_additional_filters_json(additional_filters_text)
-    if filters_error:
-        set_status(f"Error: {filters_error}")
-        log_message(filters_error)
-        return
+    # Parsed by the caller; copy it since personIds is popped out below.
+    additional_filters = dict(additional_filters or {})
 
     people_match_mode = (people_match_mode or "any").strip().lower()
     if people_match_mode not in {"any", "all"}:
@@ -590,40 +815,86 @@ def run_search(
     set_progress(0, total_tasks)
     current_progress = 0
 
-    # Helper function for date range based on delta_days
-    def get_date_range(base_date, delta):
-        if delta == 0:
-            day_start = datetime(base_date.year, base_date.month, base_date.day)
-            return day_start, day_start + timedelta(days=1)
-        else:
-            return (base_date - timedelta(days=delta), base_date + timedelta(days=delta))
+    executor = ThreadPoolExecutor(max_workers=REQUEST_WORKERS)
+
+    def search_windows_concurrently(windows):
+        """Search each (key, start, end) window in parallel; yield (key, asset_ids) as they finish."""
+        futures = {}
+        for key, start_search_date, end_search_date in windows:
+            future = executor.submit(
+                search_assets_for_date_range,
+                headers,
+                start_search_date,
+                end_search_date,
+                additional_filters=additional_filters,
+                person_ids=combined_person_ids,
+                people_match_mode=people_match_mode,
+            )
+            futures[future] = key
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+    def drop_windows_before_first_asset(windows):
+        """Skip (key, start, end) windows that end before the oldest matching asset."""
+        nonlocal current_progress
+        if not windows:
+            return windows
+        earliest = find_earliest_asset_date(
+            headers,
+            min(start for _, start, _ in windows),
+            max(end for _, _, end in windows),
+            additional_filters=additional_filters,
+        )
+        # A day of slack covers the UTC/local offset between fileCreatedAt and our naive dates.
+        kept = [w for w in windows if earliest is not None and w[2] >= earliest - timedelta(days=1)]
+        skipped = len(windows) - len(kept)
+        if skipped:
+            log_message(f"Skipping {skipped} searches that end before the oldest matching asset.")
+            current_progress += skipped
+            set_progress(current_progress, total_tasks)
+        return kept
+
+    # Asset IDs found per album, added with one PUT per album instead of one per year.
+    pending_asset_ids = defaultdict(list)
+    error_status = None
+
+    def flush_pending_assets(album_id):
+        asset_ids = list(dict.fromkeys(pending_asset_ids.pop(album_id, [])))
+        return add_assets_to_album(headers, album_id, asset_ids)
 
     try:
+        # Every holiday search window, computed up front so the loop below only dispatches HTTP.
+        holiday_plan = [
+            (album_name, holiday_name, year, *get_date_range(get_holiday_date(year, holiday_name), delta_days))
+            for holiday_name, album_name in selected_items.items()
+            if holiday_name != "Specific Date"
+            for year in range(start_year, end_year + 1)
+        ]
+
+        album_index = AlbumIndex(headers)
+
         # Specific Date
         if "Specific Date" in selected_items:
             specific_date = datetime.strptime(specific_date_str, "%Y-%m-%d")
             album_name = specific_date_album_name
-            album_id = find_or_create_album(headers, album_name)
+            album_id = album_index.get_or_create(album_name)
 
             if specific_date_all_years:
-                for year in range(start_year, end_year + 1):
+                set_status(f"Searching {album_name} for {start_year}-{end_year}...")
+                windows = [
+                    (year, *get_date_range(specific_date.replace(year=year), delta_days))
+                    for year in range(start_year, end_year + 1)
+                ]
+                windows = drop_windows_before_first_asset(windows)
+                for year, asset_ids in search_windows_concurrently(windows):
                     if stop_event.is_set():
+                        flush_pending_assets(album_id)
                         set_status("Operation Cancelled")
                         return
-                    day_replaced = specific_date.replace(year=year)
-                    start_search_date, end_search_date = get_date_range(day_replaced, delta_days)
-                    set_status(f"Searching {album_name} for {year}...")
-                    asset_ids = search_assets_for_date_range(
-                        headers,
-                        start_search_date,
-                        end_search_date,
-                        additional_filters=additional_filters,
-                        person_ids=combined_person_ids,
-                        people_match_mode=people_match_mode,
-                    )
-                    total_assets_added += add_assets_to_album(headers, album_id, asset_ids)
+                    pending_asset_ids[album_id].extend(asset_ids)
                     current_progress += 1
                     set_progress(current_progress, total_tasks)
+                total_assets_added += flush_pending_assets(album_id)
             else:
                 if stop_event.is_set():
                     set_status("Operation Cancelled")
@@ -642,36 +913,52 @@ def run_search(
                 current_progress += 1
                 set_progress(current_progress, total_tasks)
 
-        # Holidays
-        for holiday_name, album_name in selected_items.items():
-            if holiday_name == "Specific Date":
-                continue
-            album_id = find_or_create_album(headers, album_name)
-            for year in range(start_year, end_year + 1):
-                if stop_event.is_set():
-                    set_status("Operation Cancelled")
-                    return
-                holiday_date = get_holiday_date(year, holiday_name)
-                start_search_date, end_search_date = get_date_range(holiday_date, delta_days)
-                set_status(f"Searching {holiday_name} for {year}...")
-                asset_ids = search_assets_for_date_range(
-                    headers,
-                    start_search_date,
-                    end_search_date,
-                    additional_filters=additional_filters,
-                    person_ids=combined_person_ids,
-                    people_match_mode=people_match_mode,
-                )
-                total_assets_added += add_assets_to_album(headers, album_id, asset_ids)
-                current_progress += 1
-                set_progress(current_progress, total_tasks)
+        # Holidays: resolve every album first, then fan all searches out together and
+        # add each album's assets as soon as its last year finishes.
+        holiday_album_names = dict.fromkeys(
+            album_name for holiday_name, album_name in selected_items.items() if holiday_name != "Specific Date"
+        )
+        album_ids = {album_name: album_index.get_or_create(album_name) for album_name in holiday_album_names}
+        if holiday_plan:
+            set_status(f"Searching holidays for {start_year}-{end_year}...")
+        windows = drop_windows_before_first_asset([
+            ((album_name, holiday_name, year), start, end)
+            for album_name, holiday_name, year, start, end in holiday_plan
+        ])
+        remaining_searches = Counter(album_name for (album_name, _, _), _, _ in windows)
+        for (album_name, holiday_name, year), asset_ids in search_windows_concurrently(windows):
+            if stop_event.is_set():
+                for album_id in list(pending_asset_ids):
+                    flush_pending_assets(album_id)
+                set_status("Operation Cancelled")
+                return
+            album_id = album_ids[album_name]
+            pending_asset_ids[album_id].extend(asset_ids)
+            remaining_searches[album_name] -= 1
+            if not remaining_searches[album_name]:
+                total_assets_added += flush_pending_assets(album_id)
+            current_progress += 1
+            set_progress(current_progress, total_tasks)
+            set_status(f"Searched {holiday_name} for {year} ({current_progress}/{total_tasks})")
 
         set_status(f"Completed: Added {total_assets_added} assets to {len(selected_items)} albums")
         log_message(f"Completed: Added {total_assets_added} assets to {len(selected_items)} albums")
     except Exception as e:
-        set_status(f"Error: {str(e)}")
+        # Stop the searches still running, as Cancel would; their results can't be used now.
+        stop_event.set()
+        # Keep what was already found: add every album's pending assets before reporting.
+        for album_id in list(pending_asset_ids):
+            try:
+                total_assets_added += flush_pending_assets(album_id)
+            except Exception as flush_error:
+                log_message(f"Error adding found assets to album {album_id}: {str(flush_error)}")
+        error_status = f"Error: {str(e)}"
         log_message(f"Error occurred: {str(e)}")
     finally:
+        # Drop queued searches; running ones return early once stop_event is set.
+        executor.shutdown(wait=True, cancel_futures=True)
+        if error_status:
+            set_status(error_status)  # After shutdown, so late search messages can't replace it
         set_progress(0, 0)  # Reset progress bar
 
 # -------------------------------
@@ -723,7 +1010,7 @@ def show_help():
         "People filter\n"
         "- Paste names/UUIDs, or click “Browse people…” to pick from a searchable list.\n"
         "- Match any (OR): assets containing any selected person.\n"
-        "- Match all (AND): assets containing all selected people (slower; multiple searches).\n"
+        "- Match all (AND): assets containing all selected people.\n"
         "People picker search\n"
         "- OR: `jack, jill` or `jack or jill`\n"
         "- AND: `jack jill` or `jack and jill`\n\n"
@@ -778,8 +1065,7 @@ def show_help():
 # GUI Creation
 # -------------------------------
 def create_gui():
-    if os.path.exists(LOG_FILE):
-        os.remove(LOG_FILE)
+    reset_log_file()
 
     global root
     root = tk.Tk()
@@ -861,7 +1147,7 @@ def create_gui():
             return
         try:
             headers = {"x-api-key": api_key}
-            r = requests.get(f"{API_BASE_URL}/albums", headers=headers, timeout=REQUEST_TIMEOUT_SECONDS)
+            r = SESSION.get(ENDPOINTS["albums"], headers=headers, timeout=REQUEST_TIMEOUT_SECONDS)
             r.raise_for_status()
             store_api_key_in_keyring(api_key)
             messagebox.showinfo("Success", "API Key stored successfully.")
@@ -947,20 +1233,37 @@ def create_gui():
 
     holiday_vars = {}
     holiday_album_vars = {}
+    # Python-side mirrors of the vars above, kept current by write traces, so Run/Save
+    # read plain dicts instead of making two Tcl round-trips per holiday.
+    holiday_enabled = {}
+    holiday_album_names = {}
+
+    def mirror_var(var, state, key):
+        state[key] = var.get()
+        var.trace_add("write", lambda *_: state.__setitem__(key, var.get()))
+
+    # Grid options shared by every holiday row (Tk already defers the layout pass to idle time).
+    check_grid = {"column": 0, "sticky": "w", "pady": 2}
+    label_grid = {"column": 1, "sticky": "w", "pady": 2}
+    entry_grid = {"column": 2, "sticky": "w", "pady": 2, "padx": (10, 0)}
 
     for i, holiday in enumerate(DEFAULT_HOLIDAYS, start=3):
         var = tk.BooleanVar(value=False)
         album_var = tk.StringVar(value=holiday)
         holiday_vars[holiday] = var
         holiday_album_vars[holiday] = album_var
+        mirror_var(var, holiday_enabled, holiday)
+        mirror_var(album_var, holiday_album_names, holiday)
 
-        ttk.Checkbutton(holidays_tab, variable=var).grid(row=i, column=0, sticky="w", pady=2)
-        ttk.Label(holidays_tab, text=holiday).grid(row=i, column=1, sticky="w", pady=2)
-        ttk.Entry(holidays_tab, textvariable=album_var, width=30).grid(row=i, column=2, sticky="w", pady=2, padx=(10, 0))
+        ttk.Checkbutton(holidays_tab, variable=var).grid(row=i, **check_grid)
+        ttk.Label(holidays_tab, text=holiday).grid(row=i, **label_grid)
+        ttk.Entry(holidays_tab, textvariable=album_var, width=30).grid(row=i, **entry_grid)
 
     def set_all_holidays(enabled):
+        # The mirror says which boxes already match; skip their Tcl write and trace callback.
         for h in DEFAULT_HOLIDAYS:
-            holiday_vars[h].set(enabled)
+            if holiday_enabled[h] != enabled:
+                holiday_vars[h].set(enabled)
 
     holiday_actions = ttk.Frame(holidays_tab)
     holiday_actions.grid(row=len(DEFAULT_HOLIDAYS) + 3, column=0, columnspan=3, sticky="w", pady=(10, 0))
@@ -968,6 +1271,23 @@ def create_gui():
     ttk.Button(holiday_actions, text="Clear all", command=lambda: set_all_holidays(False)).grid(row=0, column=1)
 
     # Advanced tab
+    def cached_text_reader(text_widget):
+        """Return a getter for the widget's contents that only copies the buffer after an edit.
+
+        Tk sets the widget's modified flag synchronously on every insert/delete, so checking
+        it is a cheap Tcl call compared with transferring the whole buffer.
+        """
+        cached = None
+
+        def get_text():
+            nonlocal cached
+            if cached is None or text_widget.edit_modified():
+                cached = text_widget.get("1.0", tk.END)
+                text_widget.edit_modified(False)
+            return cached
+
+        return get_text
+
     advanced_tab.columnconfigure(0, weight=1)
 
     people_frame = ttk.Labelframe(advanced_tab, text="People filter", padding=10)
@@ -976,6 +1296,7 @@ def create_gui():
 
     ttk.Label(people_frame, text="Enter names/UUIDs, or pick from a searchable list.").grid(row=0, column=0, sticky="w")
     people_text = tk.Text(people_frame, height=4, width=60)
+    get_people_text = cached_text_reader(people_text)
     people_text.grid(row=1, column=0, sticky="ew", pady=(6, 0))
 
     people_match_var = tk.StringVar(value="any")
@@ -984,8 +1305,10 @@ def create_gui():
     ttk.Radiobutton(match_row, text="Match all (AND)", variable=people_match_var, value="all").grid(row=0, column=1)
 
     people_with_hidden_var = tk.BooleanVar(value=False)
+    show_people_picker = None  # Reopens the picker once built; it is hidden, not destroyed, on close
 
     def open_people_picker():
+        nonlocal show_people_picker
         if not API_BASE_URL:
             messagebox.showerror(
                 "Error",
@@ -1002,13 +1325,16 @@ def create_gui():
             messagebox.showerror("Error", "API Key is required.")
             return
 
-        headers = {"x-api-key": api_key, "Accept": "application/json"}
+        if show_people_picker is not None:
+            show_people_picker(api_key)
+            return
+
+        auth = {}
 
         picker = tk.Toplevel(root)
         picker.title("Select People")
         picker.geometry("720x520")
         picker.transient(root)
-        picker.grab_set()
 
         picker.columnconfigure(0, weight=1)
         picker.rowconfigure(1, weight=1)
@@ -1043,8 +1369,16 @@ def create_gui():
         footer.grid(row=2, column=0, sticky="ew")
         footer.columnconfigure(0, weight=1)
 
-        all_people = []
+        all_people = []  # (person, name_casefolded, display_text), precomputed by the loader
+        all_display_texts = []  # Listbox rows for the unfiltered view, swapped in wholesale
+        # Refreshed on every open; while shown the picker is modal (grab_set), so the People
+        # text can only change through add_selected.
+        existing_ids = set()
         filtered_people = []
+        pending_filter_id = None
+        last_filter_text = None
+        loaded_cache_key = None
+        listbox_generation = 0  # Bumped whenever the listbox is cleared; stale batch fills stop
 
         def parse_people_search_expression(text):
             expr = (text or "").strip()
@@ -1053,17 +1387,17 @@ def create_gui():
 
             or_parts = [
                 p.strip()
-                for p in re.split(r"\s*(?:,|;|\|\|?|\bor\b)\s*", expr, flags=re.IGNORECASE)
+                for p in PEOPLE_SEARCH_OR_PATTERN.split(expr)
                 if p.strip()
             ]
 
             clauses = []
             for part in or_parts:
-                part = re.sub(r"\band\b", " ", part, flags=re.IGNORECASE)
+                part = PEOPLE_SEARCH_AND_PATTERN.sub(" ", part)
                 part = part.replace("&&", " ").replace("&", " ")
                 terms = [
                     t.strip().strip("\"'").casefold()
-                    for t in re.split(r"\s+", part)
+                    for t in WHITESPACE_PATTERN.split(part)
                     if t.strip()
                 ]
                 if terms:
@@ -1071,54 +1405,128 @@ def create_gui():
 
             return clauses
 
-        def apply_filter(*_):
-            clauses = parse_people_search_expression(filter_var.get())
+        def clear_listbox():
+            nonlocal listbox_generation
+            listbox_generation += 1
             listbox.delete(0, tk.END)
-            filtered_people.clear()
-
-            for person in all_people:
-                person_id = str(person.get("id", "")).strip()
-                if not person_id:
-                    continue
 
-                name = str(person.get("name", "")).strip()
-                if not name:
-                    continue
-
-                name_cf = name.casefold()
-                if clauses and not any(all(term in name_cf for term in clause) for clause in clauses):
-                    continue
+        def fill_listbox(display_texts, start, generation):
+            # Insert in batches so a huge list doesn't block typing/scrolling while it fills.
+            if generation != listbox_generation or not picker.winfo_exists():
+                return
+            batch = display_texts[start:start + LISTBOX_INSERT_BATCH]
+            if batch:
+                listbox.insert(tk.END, *batch)
+                picker.after(1, fill_listbox, display_texts, start + LISTBOX_INSERT_BATCH, generation)
+
+        def apply_filter():
+            nonlocal last_filter_text
+            filter_text = filter_var.get()
+            if filter_text == last_filter_text:
+                return
+            last_filter_text = filter_text
+
+            clauses = parse_people_search_expression(filter_text)
+            if clauses:
+                # Test each distinct term once per name, then check clauses as subsets of the hits.
+                unique_terms = {term for clause in clauses for term in clause}
+                clause_sets = [frozenset(clause) for clause in clauses]
+                matches = []
+                for entry in all_people:
+                    name_cf = entry[1]
+                    present = {term for term in unique_terms if term in name_cf}
+                    if any(clause_set <= present for clause_set in clause_sets):
+                        matches.append(entry)
+                display_texts = [display_text for _, _, display_text in matches]
+            else:
+                matches = all_people
+                display_texts = all_display_texts
 
-                is_hidden = bool(person.get("isHidden", False))
-                label = f"{name} [hidden]" if is_hidden else name
-                short_id = person_id.split("-", 1)[0]
-                listbox.insert(tk.END, f"{label}  —  {short_id}")
-                filtered_people.append(person)
+            # Rebuild only when the result changed (e.g. not for a trailing space); that also
+            # keeps the current selection. Otherwise one delete + batched multi-item inserts.
+            people = [person for person, _, _ in matches]
+            if people != filtered_people:
+                clear_listbox()
+                filtered_people[:] = people
+                fill_listbox(display_texts, 0, listbox_generation)
 
             if all_people:
                 status_var.set(f"Showing {len(filtered_people)} of {len(all_people)} people")
 
-        def load_people():
+        def schedule_filter(*_):
+            # Debounce typing so a burst of keystrokes triggers a single filter pass.
+            nonlocal pending_filter_id
+            if pending_filter_id is not None:
+                picker.after_cancel(pending_filter_id)
+            pending_filter_id = picker.after(120, run_scheduled_filter)
+
+        def run_scheduled_filter():
+            nonlocal pending_filter_id
+            pending_filter_id = None
+            if picker.winfo_exists():
+                apply_filter()
+
+        def current_cache_key():
+            # Hash the key so the raw secret isn't kept around as a dict key.
+            api_key_hash = hashlib.sha256(auth["api_key"].encode("utf-8")).hexdigest()
+            return (API_BASE_URL, api_key_hash, bool(include_hidden_var.get()))
+
+        def load_people(force_refresh=False):
+            nonlocal loaded_cache_key, last_filter_text
             status_var.set("Loading people…")
-            listbox.delete(0, tk.END)
+            clear_listbox()
             filtered_people.clear()
+            # Drop the previous list so filtering can't show (or add) people from another key/server
+            # while this load runs or after it fails.
+            all_people[:] = []
+            all_display_texts[:] = []
+            last_filter_text = None
+
+            cache_key = current_cache_key()
+            with_hidden = cache_key[2]
+            headers = auth["headers"]
+            loaded_cache_key = cache_key
+            if force_refresh:
+                people_cache.pop(cache_key, None)
 
             def worker():
-                try:
-                    people = get_all_people(headers, with_hidden=bool(include_hidden_var.get()))
-                except Exception as e:
-                    error_text = str(e).strip() or repr(e)
-                    root.after(0, lambda msg=error_text: status_var.set(f"Error loading people: {msg}"))
-                    return
-
-                people_sorted = sorted(
-                    [p for p in people if str(p.get("name", "")).strip()],
-                    key=lambda p: (str(p.get("name", "")).casefold(), str(p.get("id", ""))),
-                )
+                cached = people_cache.get(cache_key)
+                if cached and time.monotonic() - cached[0] < PEOPLE_CACHE_TTL_SECONDS:
+                    _, people_entries, display_texts = cached
+                else:
+                    try:
+                        people = get_all_people(headers, with_hidden=with_hidden)
+                    except Exception as e:
+                        error_text = str(e).strip() or repr(e)
+                        root.after(0, lambda msg=error_text: status_var.set(f"Error loading people: {msg}"))
+                        return
+
+                    # Casefold/format each person once here, off the UI thread, instead of per keystroke.
+                    # The casefolded name doubles as the sort key, so sorting needs no per-item lambda.
+                    prepped = []
+                    for person in people:
+                        person_id = str(person.get("id", "")).strip()
+                        name = str(person.get("name", "")).strip()
+                        if not person_id or not name:
+                            continue
+                        prepped.append((name.casefold(), person_id, name, person))
+                    prepped.sort(key=operator.itemgetter(0, 1))
+
+                    people_entries = []
+                    for name_cf, person_id, name, person in prepped:
+                        label = f"{name} [hidden]" if person.get("isHidden", False) else name
+                        short_id = person_id.split("-", 1)[0]
+                        people_entries.append((person, name_cf, f"{label}  —  {short_id}"))
+                    display_texts = [display_text for _, _, display_text in people_entries]
+                    people_cache[cache_key] = (time.monotonic(), people_entries, display_texts)
 
                 def done():
-                    all_people.clear()
-                    all_people.extend(people_sorted)
+                    nonlocal last_filter_text
+                    if cache_key != loaded_cache_key:
+                        return  # A newer load (other key/server/hidden setting) superseded this one
+                    last_filter_text = None  # New data: re-filter even if the query is unchanged
+                    all_people[:] = people_entries
+                    all_display_texts[:] = display_texts
                     apply_filter()
                     if not all_people:
                         status_var.set("No people found.")
@@ -1132,9 +1540,6 @@ def create_gui():
             if not indices:
                 return
 
-            existing_tokens = parse_people_input(people_text.get("1.0", tk.END))
-            existing_ids = {t for t in existing_tokens if UUID_PATTERN.match(t)}
-
             lines_to_add = []
             for idx in indices:
                 person = filtered_people[int(idx)]
@@ -1147,24 +1552,52 @@ def create_gui():
                 existing_ids.add(person_id)
 
             if lines_to_add:
-                current = people_text.get("1.0", tk.END).rstrip()
-                if current and not current.endswith("\n"):
+                # Check just the last character instead of copying the whole buffer.
+                if people_text.compare("end-1c", "!=", "1.0") and people_text.get("end-2c") != "\n":
                     people_text.insert(tk.END, "\n")
                 people_text.insert(tk.END, "\n".join(lines_to_add) + "\n")
 
             if close_after:
-                picker.destroy()
-
-        ttk.Button(footer, text="Reload", command=load_people).grid(row=0, column=0, sticky="w")
+                hide_picker()
+
+        def hide_picker():
+            picker.grab_release()
+            picker.withdraw()
+
+        def show_picker(new_api_key):
+            auth["api_key"] = new_api_key
+            auth["headers"] = {"x-api-key": new_api_key, "Accept": "application/json"}
+            include_hidden_var.set(bool(people_with_hidden_var.get()))
+            existing_ids.clear()
+            # One scan of the raw text instead of tokenizing and validating each token.
+            existing_ids.update(UUID_FINDALL_PATTERN.findall(get_people_text()))
+
+            picker.deiconify()
+            picker.lift()
+            picker.grab_set()
+            filter_entry.focus_set()
+
+            # Keep the populated list unless the server/key/hidden setting changed or it went stale.
+            cache_key = current_cache_key()
+            cached = people_cache.get(cache_key)
+            if (
+                cache_key != loaded_cache_key
+                or not cached
+                or time.monotonic() - cached[0] >= PEOPLE_CACHE_TTL_SECONDS
+            ):
+                picker.after(0, load_people)
+
+        ttk.Button(footer, text="Reload", command=lambda: load_people(force_refresh=True)).grid(row=0, column=0, sticky="w")
         ttk.Button(footer, text="Add selected", command=lambda: add_selected(False)).grid(row=0, column=1, sticky="e", padx=(6, 0))
         ttk.Button(footer, text="Add & close", command=lambda: add_selected(True)).grid(row=0, column=2, sticky="e", padx=(6, 0))
-        ttk.Button(footer, text="Close", command=picker.destroy).grid(row=0, column=3, sticky="e", padx=(6, 0))
+        ttk.Button(footer, text="Close", command=hide_picker).grid(row=0, column=3, sticky="e", padx=(6, 0))
 
-        filter_var.trace_add("write", apply_filter)
+        filter_var.trace_add("write", schedule_filter)
         include_hidden_check.configure(command=load_people)
         listbox.bind("<Double-Button-1>", lambda _e: add_selected(True))
-        picker.after(0, load_people)
-        filter_entry.focus_set()
+        picker.protocol("WM_DELETE_WINDOW", hide_picker)
+        show_people_picker = show_picker
+        show_picker(api_key)
 
     people_actions = ttk.Frame(people_frame)
     people_actions.grid(row=2, column=0, sticky="w", pady=(6, 8))
@@ -1185,10 +1618,11 @@ def create_gui():
 
     ttk.Label(filters_frame, text='Example: {"isFavorite": true, "city": "Boston"}').grid(row=0, column=0, sticky="w")
     additional_filters_text = tk.Text(filters_frame, height=6, width=60)
+    get_additional_filters_text = cached_text_reader(additional_filters_text)
     additional_filters_text.grid(row=1, column=0, sticky="nsew", pady=(6, 0))
 
     def validate_filters():
-        _, err = parse_additional_filters_json(additional_filters_text.get("1.0", tk.END))
+        _, err = parse_additional_filters_json(get_additional_filters_text())
         if err:
             messagebox.showerror("Invalid JSON", err)
         else:
@@ -1221,11 +1655,7 @@ def create_gui():
     progress_bar = ttk.Progressbar(action_bar, orient="horizontal", mode="determinate")
     progress_bar.grid(row=0, column=1, sticky="ew", padx=10)
 
-    current_thread = None
-
     def run_search_in_background():
-        nonlocal current_thread
-
         if not API_BASE_URL:
             messagebox.showerror(
                 "Error",
@@ -1268,19 +1698,19 @@ def create_gui():
             selected_items["Specific Date"] = album_name
 
         for holiday in DEFAULT_HOLIDAYS:
-            if holiday_vars[holiday].get():
-                album_name = holiday_album_vars[holiday].get().strip() or holiday
+            if holiday_enabled[holiday]:
+                album_name = holiday_album_names[holiday].strip() or holiday
                 selected_items[holiday] = album_name
 
         if not selected_items:
             messagebox.showerror("Error", "Select at least one holiday or a specific date.")
             return
 
-        people_query = people_text.get("1.0", tk.END).strip()
+        people_query = get_people_text().strip()
         people_match_mode = people_match_var.get()
-        filters_text = additional_filters_text.get("1.0", tk.END).strip()
+        filters_text = get_additional_filters_text().strip()
         with_hidden_people = bool(people_with_hidden_var.get())
-        _, filters_error = parse_additional_filters_json(filters_text)
+        additional_filters, filters_error = parse_additional_filters_json(filters_text)
         if filters_error:
             messagebox.showerror("Invalid additional filters", filters_error)
             return
@@ -1288,8 +1718,15 @@ def create_gui():
         run_button.configure(state="disabled")
         cancel_button.configure(state="normal")
 
-        current_thread = threading.Thread(
-            target=run_search,
+        def run_and_signal(*args):
+            # The UI poller re-enables the buttons when it sees the flag; no separate thread check.
+            try:
+                run_search(*args)
+            finally:
+                progress_state.mark_run_finished()
+
+        worker_thread = threading.Thread(
+            target=run_and_signal,
             args=(
                 api_key,
                 delta_days,
@@ -1301,21 +1738,12 @@ def create_gui():
                 bool(specific_date_all_years_var.get()),
                 people_query,
                 people_match_mode,
-                filters_text,
+                additional_filters,
                 with_hidden_people,
             ),
             daemon=True,
         )
-        current_thread.start()
-
-        def check_thread():
-            if current_thread and not current_thread.is_alive():
-                run_button.configure(state="normal")
-                cancel_button.configure(state="disabled")
-            else:
-                root.after(150, check_thread)
-
-        root.after(150, check_thread)
+        worker_thread.start()
 
     def cancel_run():
         stop_event.set()
@@ -1327,8 +1755,8 @@ def create_gui():
         if specific_date_enabled.get():
             selected_items["Specific Date"] = specific_date_album_var.get().strip() or "Specific Date Search"
         for holiday in DEFAULT_HOLIDAYS:
-            if holiday_vars[holiday].get():
-                selected_items[holiday] = holiday_album_vars[holiday].get().strip() or holiday
+            if holiday_enabled[holiday]:
+                selected_items[holiday] = holiday_album_names[holiday].strip() or holiday
 
         preset = {
             "delta_days": delta_var.get().strip(),
@@ -1338,10 +1766,10 @@ def create_gui():
             "specific_date": specific_date_entry.get_date().strftime("%Y-%m-%d") if specific_date_enabled.get() else "",
             "specific_date_all_years": 1 if specific_date_all_years_var.get() else 0,
             "specific_date_album_name": specific_date_album_var.get().strip() or "Specific Date Search",
-            "people": people_text.get("1.0", tk.END).strip(),
+            "people": get_people_text().strip(),
             "people_match_mode": people_match_var.get(),
             "people_with_hidden": 1 if people_with_hidden_var.get() else 0,
-            "additional_filters": additional_filters_text.get("1.0", tk.END).strip(),
+            "additional_filters": get_additional_filters_text().strip(),
         }
         save_config(preset)
         set_status(f"Saved preset to {os.path.basename(PRESETS_FILE)}")
@@ -1398,22 +1826,31 @@ def create_gui():
     status_label = ttk.Label(main, textvariable=status_var)
     status_label.grid(row=5, column=0, sticky="ew", pady=(10, 0))
 
-    # Progress Queue and Update Function
+    # Progress State and Update Function
+    empty_polls = 0
+
     def update_progress():
-        try:
-            while True:
-                msg = progress_queue.get_nowait()
-                if msg["type"] == "status":
-                    status_var.set(msg["text"])
-                elif msg["type"] == "progress":
-                    progress_bar["value"] = msg["value"]
-                    progress_bar["maximum"] = msg["max"]
-                elif msg["type"] == "log":
-                    log_viewer.insert(tk.END, msg["text"] + "\n")
-                    log_viewer.see(tk.END)
-        except queue.Empty:
-            pass
-        root.after(100, update_progress)
+        nonlocal empty_polls
+        status, progress, log_lines, run_finished = progress_state.drain()
+        if run_finished:
+            run_button.configure(state="normal")
+            cancel_button.configure(state="disabled")
+        if status is not None:
+            status_var.set(status)
+        if progress is not None:
+            progress_bar["value"], progress_bar["maximum"] = progress
+        if log_lines:
+            # One insert + one scroll per tick, however many lines were logged.
+            log_viewer.insert(tk.END, "\n".join(log_lines) + "\n")
+            log_viewer.see(tk.END)
+
+        # Poll quickly while updates are flowing; back off towards 500ms when idle.
+        if status is None and progress is None and not log_lines and not run_finished:
+            empty_polls += 1
+            root.after(min(500, 100 + empty_polls * 50), update_progress)
+        else:
+            empty_polls = 0
+            root.after(50, update_progress)
 
     update_progress()
 